@@ -1,96 +1,322 @@
+import mmap
 import re
+from collections import defaultdict
+from functools import cached_property, lru_cache
 from pathlib import Path
 from datetime import datetime
 from ..models.schema import SchemaModel, Table, Column, View, Procedure, ProcedureParameter, PrimaryKey, ForeignKey
 
+# Patterns are compiled once at import rather than on every parse. Those
+# scanning the file are bytes patterns run over the memory-mapped export;
+# column and parameter patterns run on decoded block text. Construct patterns
+# are written in uppercase and matched against an uppercased copy of the file
+# instead of using IGNORECASE.
+#
+# Bytes \w is ASCII-only, whereas Oracle allows database-charset letters in
+# unquoted identifiers, so names are matched with [\w\x80-\xff]: the UTF-8
+# lead and continuation bytes of any non-ASCII character.
+#
+# Possessive quantifiers and atomic groups (Python 3.11+) are used wherever
+# the text that follows cannot start with what was consumed, so they never
+# change what matches. (?>\s*\n\s*) in particular stops the engine trying
+# every newline in a whitespace run, which is quadratic in its length.
+
+# Header metadata, which Toad writes in the first lines of the export
+_RE_META = re.compile(rb'Database Version\s+:\s+(?P<ver>[^\r\n]+)|--\s+Schema\s+:\s+(?P<schema>[\w\x80-\xff]+)')
+_HEADER_SIZE = 4096
+
+# Lone carriage returns, which text mode would have read as line ends
+_RE_LONE_CR = re.compile(rb'\r(?!\n)')
+
+# CREATE TABLE blocks (with optional schema prefix)
+_RE_TABLE = re.compile(
+    rb'CREATE TABLE\s++(?:([\w\x80-\xff]++)\.)?([\w\x80-\xff]++)\s*+\(\s*\n(.*?)\r?\n\)(?>\s*\n)(?:TABLESPACE|;)',
+    re.DOTALL
+)
+_RE_ROWCOUNT = re.compile(r'--\s+Row Count:\s*(\d+)')
+_ROWCOUNT_WINDOW = 200  # Characters of decoded text searched before CREATE TABLE
+
+# Column definitions within a CREATE TABLE block
+_TYPES = frozenset({
+    'VARCHAR2', 'NUMBER', 'DATE', 'TIMESTAMP', 'CHAR', 'CLOB', 'BLOB',
+    'INTEGER', 'XMLTYPE', 'RAW', 'SYS.XMLTYPE',
+})
+_SKIP = frozenset({'SUPPLEMENTAL', 'CONSTRAINT', 'PRIMARY', 'FOREIGN', 'UNIQUE', 'CHECK'})
+_RE_SIZE = re.compile(r'\((\d+)(?:\s*BYTE)?(?:,(\d+))?\)', re.IGNORECASE)
+_RE_DEFAULT = re.compile(r'DEFAULT\s+(.+?)(?:\s++NOT|\s++NULL|\s*+$)', re.IGNORECASE)
+
+# COMMENT ON statements
+_RE_TABLE_COMMENT = re.compile(rb"COMMENT\s+ON\s+TABLE\s+[\w\x80-\xff]+\.([\w\x80-\xff]+)\s+IS\s+'((?:[^']|'')*)'")
+_RE_COL_COMMENT = re.compile(rb"COMMENT\s+ON\s+COLUMN\s+[\w\x80-\xff]+\.([\w\x80-\xff]+)\.([\w\x80-\xff]+)\s+IS\s+'((?:[^']|'')*)'")
+
+# CREATE OR REPLACE FORCE VIEW blocks (with optional schema prefix)
+_RE_VIEW = re.compile(
+    rb'CREATE\s++OR\s++REPLACE\s++FORCE\s++VIEW\s++(?:([\w\x80-\xff]++)\.)?([\w\x80-\xff]++)(?>\s*\n)'
+    rb'\((.*?)\)(?>\s*\n)'  # Column list
+    rb'(?:BEQUEATH\s++DEFINER(?>\s*\n))?'  # Optional BEQUEATH clause
+    rb'AS\s*\n'
+    rb'(.*?)'  # SELECT statement
+    rb'(?=\r?\n\r?\n--|\r?\nGRANT|\r?\nCREATE|\Z)',  # Stop at next section
+    re.DOTALL
+)
+
+# Package specifications (with optional schema prefix) and their procedures
+_RE_PACKAGE = re.compile(
+    rb'CREATE\s++OR\s++REPLACE\s++PACKAGE\s++(?:([\w\x80-\xff]++)\.)?([\w\x80-\xff]++)\s++(?:AS|IS)\s*\n'
+    rb'(.*?)'
+    rb'\r?\nEND\s++[\w\x80-\xff]++;',
+    re.DOTALL
+)
+_RE_PROC = re.compile(rb'PROCEDURE\s+([\w\x80-\xff]+)\s*\((.*?)\);', re.DOTALL)
+
+# Procedure parameters: one match per comma-separated entry,
+# name [IN|OUT|IN OUT] type. Entries that are not of that form match the
+# empty-group fallback and are skipped. Possessive quantifiers (Python 3.11+)
+# keep the engine from backtracking into runs that can never split differently.
+_RE_PARAM_ANY = re.compile(
+    r'\s*+(?:(\w++)\s++(?:(IN\s++OUT|OUT|IN)\s++)?([^,]+?)|[^,]*+)\s*(?:,|\Z)',
+    re.IGNORECASE
+)
+
+# Comma-separated column lists, splitting and trimming in one pass. Newlines
+# inside an element are folded to spaces first. Only '\n' is mapped: line endings are
+# already folded by _groups, and tabs were never replaced.
+_WS_TRANS = str.maketrans({'\n': ' '})
+_RE_COMMA = re.compile(r'\s*,\s*')
+
+# ALTER TABLE ... ADD PRIMARY KEY / FOREIGN KEY
+_RE_PK = re.compile(
+    rb'ALTER\s++TABLE\s++([\w\x80-\xff]++)\s++ADD\s++\((?>\s*\n\s*)'
+    rb'CONSTRAINT\s++([\w\x80-\xff]++)(?>\s*\n\s*)'
+    rb'PRIMARY\s++KEY(?>\s*\n\s*)'
+    rb'\((.*?)\)',
+    re.DOTALL
+)
+_RE_FK = re.compile(
+    rb'ALTER\s++TABLE\s++([\w\x80-\xff]++)\s++ADD\s++\((?>\s*\n\s*)'
+    rb'CONSTRAINT\s++([\w\x80-\xff]++)(?>\s*\n\s*)'
+    rb'FOREIGN\s++KEY\s++\((.*?)\)(?>\s*\n\s*)'
+    rb'REFERENCES\s++([\w\x80-\xff]++)\s++\((.*?)\)',
+    re.DOTALL
+)
+
+# Heads of the top-level constructs, located in a single pass over the file.
+# Only the head is matched there: a full-construct alternation would let a lazy
+# view or package body swallow COMMENT/ALTER statements the per-construct
+# patterns must still see.
+_HEADS = {
+    'tbl': rb'CREATE TABLE',
+    'tcmt': rb'COMMENT\s+ON\s+TABLE',
+    'ccmt': rb'COMMENT\s+ON\s+COLUMN',
+    'view': rb'CREATE\s+OR\s+REPLACE\s+FORCE\s+VIEW',
+    'pkg': rb'CREATE\s+OR\s+REPLACE\s+PACKAGE',
+    'alter': rb'ALTER\s+TABLE',
+}
+
+# Full patterns tried, in order, at each head
+_CONSTRUCTS = {
+    'tbl': (_RE_TABLE,),
+    'tcmt': (_RE_TABLE_COMMENT,),
+    'ccmt': (_RE_COL_COMMENT,),
+    'view': (_RE_VIEW,),
+    'pkg': (_RE_PACKAGE,),
+    'alter': (_RE_PK, _RE_FK),
+}
+
+# Literal keywords each full pattern needs. A substring check on the uppercased
+# file is far cheaper than the regex engine, so constructs whose keywords are
+# absent are left out of the scan altogether.
+_KEYWORDS = {
+    _RE_TABLE: (b'CREATE TABLE',),
+    _RE_TABLE_COMMENT: (b'COMMENT',),
+    _RE_COL_COMMENT: (b'COMMENT', b'COLUMN'),
+    _RE_VIEW: (b'FORCE', b'VIEW'),
+    _RE_PACKAGE: (b'PACKAGE',),
+    _RE_PK: (b'PRIMARY',),
+    _RE_FK: (b'FOREIGN', b'REFERENCES'),
+}
+
+@lru_cache(maxsize=None)
+def _master(kinds: tuple[str, ...]) -> re.Pattern:
+    """Alternation of the heads of ``kinds``, one named group per kind.
+
+    The leading lookahead lets the engine skip ahead to candidate first
+    characters instead of trying every branch at every position.
+    """
+    return re.compile(
+        rb'(?=[AC])(?:' + b'|'.join(b'(?P<%s>%s)' % (kind.encode(), _HEADS[kind]) for kind in kinds) + b')'
+    )
+
 class ToadDdlParser:
     """Parses Toad 'Create Schema Script' SQL exports."""
     
     def __init__(self, file_path: Path):
         self.file_path = file_path
-        self.content = file_path.read_text(encoding='utf-8')
+        # Map the export rather than decoding it whole; only captured spans
+        # are decoded (see _groups). mmap cannot map an empty file.
+        with open(file_path, 'rb') as f:
+            if file_path.stat().st_size:
+                self.content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self.content = b''
+        # Case-normalized copy that keyword prefilters and construct patterns
+        # run against. bytes.upper() is ASCII-only, so offsets line up with
+        # self.content and captured text is sliced from the original. Slicing
+        # the map reads the whole file into a temporary bytes copy, so the
+        # export is held in memory twice until upper() returns.
+        self._upper = self.content[:].upper()
+        # Patterns expect \r?\n line ends; a lone CR becomes LF in place so
+        # offsets still line up
+        if b'\r' in self._upper:
+            self._upper = _RE_LONE_CR.sub(b'\n', self._upper)
     
     def parse(self) -> SchemaModel:
         """Parse the Toad DDL file and return SchemaModel."""
-        metadata = self._parse_metadata()
-        tables = self._parse_tables()
-        table_comments = self._parse_table_comments()
-        column_comments = self._parse_column_comments()
-        views = self._parse_views()
-        procedures = self._parse_procedures()
-        primary_keys = self._parse_primary_keys()
-        foreign_keys = self._parse_foreign_keys()
+        found = self._scan()
+        tables = self._parse_tables(found[_RE_TABLE])
+        table_comments = self._parse_table_comments(found[_RE_TABLE_COMMENT])
+        column_comments = self._parse_column_comments(found[_RE_COL_COMMENT])
+        views = self._parse_views(found[_RE_VIEW])
+        procedures = self._parse_procedures(found[_RE_PACKAGE])
+        primary_keys = self._parse_primary_keys(found[_RE_PK])
+        foreign_keys = self._parse_foreign_keys(found[_RE_FK])
 
         # Apply comments and constraints to tables
         for table in tables:
             table.comment = table_comments.get(table.name)
-            for col in table.columns:
-                col.comment = column_comments.get(table.name, {}).get(col.name)
+
+            # Columns default to no comment; only visit them when the table has some
+            col_comments = column_comments.get(table.name)
+            if col_comments:
+                for col in table.columns:
+                    comment = col_comments.get(col.name)
+                    if comment is not None:
+                        col.comment = comment
 
             # Apply primary key
-            if table.name in primary_keys:
-                table.primary_key = primary_keys[table.name]
+            pk = primary_keys.get(table.name)
+            if pk is not None:
+                table.primary_key = pk
 
             # Apply foreign keys
-            if table.name in foreign_keys:
-                table.foreign_keys = foreign_keys[table.name]
+            fks = foreign_keys.get(table.name)
+            if fks is not None:
+                table.foreign_keys = fks
 
+        # Nested models are built with model_construct() (or are plain
+        # dataclasses) from already-typed regex captures; only the top-level
+        # model goes through validation.
         return SchemaModel(
             database_type='oracle',
-            database_version=metadata.get('database_version'),
-            schema_name=metadata.get('schema_name', 'UNKNOWN'),
+            database_version=self.metadata.get('database_version'),
+            schema_name=self.metadata.get('schema_name', 'UNKNOWN'),
             extracted_at=datetime.now(),
             tables=tables,
             views=views,
             procedures=procedures
         )
     
-    def _parse_metadata(self) -> dict:
-        """Extract header metadata."""
+    def _scan(self) -> dict[re.Pattern, list[re.Match]]:
+        """Collect matches for every top-level construct in one pass.
+
+        Each full pattern resumes after its own previous match, so the result
+        is the same as running ``pattern.finditer`` over the file per construct.
+        """
+        found = {pattern: [] for patterns in _CONSTRUCTS.values() for pattern in patterns}
+        resume = dict.fromkeys(found, 0)
+
+        constructs = {}
+        for kind, patterns in _CONSTRUCTS.items():
+            present = tuple(
+                pattern for pattern in patterns
+                if all(keyword in self._upper for keyword in _KEYWORDS[pattern])
+            )
+            if present:
+                constructs[kind] = present
+        if not constructs:
+            return found
+
+        for head in _master(tuple(constructs)).finditer(self._upper):
+            pos = head.start()
+            for pattern in constructs[head.lastgroup]:
+                if pos < resume[pattern]:
+                    continue
+                match = pattern.match(self._upper, pos)
+                if match:
+                    resume[pattern] = match.end()
+                    found[pattern].append(match)
+
+        return found
+
+    def _groups(self, match: re.Match) -> tuple[str | None, ...]:
+        """Decode a match's captured groups, folding CRLF and lone CR to LF as text mode would.
+
+        Groups are sliced from the original content by span, so matches made
+        against the uppercased copy keep their original case.
+        """
+        groups = []
+        for i in range(1, match.re.groups + 1):
+            start, end = match.span(i)
+            if start < 0:
+                groups.append(None)
+            else:
+                groups.append(self.content[start:end].decode('utf-8').replace('\r\n', '\n').replace('\r', '\n'))
+        return tuple(groups)
+
+    @cached_property
+    def metadata(self) -> dict:
+        """Header metadata, extracted once per parser."""
         result = {}
         
-        version_match = re.search(r'Database Version\s+:\s+(.+)', self.content)
-        if version_match:
-            result['database_version'] = version_match.group(1).strip()
-        
-        schema_match = re.search(r'--\s+Schema\s+:\s+(\w+)', self.content)
-        if schema_match:
-            result['schema_name'] = schema_match.group(1).strip()
+        # One pass over the header only; the first occurrence of each wins.
+        # Matches must start within _HEADER_SIZE but may run to the end of
+        # that line, so a value straddling the boundary is never cut short.
+        header_end = self.content.find(b'\n', _HEADER_SIZE)
+        if header_end < 0:
+            header_end = len(self.content)
+        for match in _RE_META.finditer(self.content, 0, header_end):
+            if match.start() >= _HEADER_SIZE:
+                break
+            version, schema_name = self._groups(match)
+            if version is not None:
+                result.setdefault('database_version', version.strip())
+            else:
+                result.setdefault('schema_name', schema_name.strip())
+            if len(result) == 2:
+                break
         
         return result
     
-    def _parse_tables(self) -> list[Table]:
+    def _parse_tables(self, matches: list[re.Match]) -> list[Table]:
         """Extract table definitions."""
         tables = []
 
-        # Pattern to match CREATE TABLE blocks (with optional schema prefix)
-        pattern = re.compile(
-            r'CREATE TABLE\s+(?:(\w+)\.)?(\w+)\s*\(\s*\n(.*?)\n\)\s*\n(?:TABLESPACE|;)',
-            re.DOTALL | re.IGNORECASE
-        )
-
         # Get default schema from metadata
-        metadata = self._parse_metadata()
-        default_schema = metadata.get('schema_name', 'UNKNOWN')
+        default_schema = self.metadata.get('schema_name', 'UNKNOWN')
 
-        for match in pattern.finditer(self.content):
-            schema_name, table_name, columns_block = match.groups()
+        for match in matches:
+            schema_name, table_name, columns_block = self._groups(match)
 
             # Use default schema if not specified
             if not schema_name:
                 schema_name = default_schema
 
-            # Look for row count in preceding comment (within 200 chars before CREATE TABLE)
+            # Look for row count in preceding comment (within 200 chars before CREATE TABLE).
+            # A character is at most 4 bytes (CRLF is 2), so decode a window that
+            # wide and keep its last 200 characters; a character cut at the start
+            # of the byte window lies outside them and is dropped.
             row_count = 0
-            start_pos = max(0, match.start() - 200)
-            preceding_text = self.content[start_pos:match.start()]
-            row_match = re.search(r'--\s+Row Count:\s*(\d+)', preceding_text)
-            if row_match:
-                row_count = int(row_match.group(1))
+            start_pos = max(0, match.start() - 4 * _ROWCOUNT_WINDOW)
+            preceding_bytes = self.content[start_pos:match.start()]
+            if b'Row Count:' in preceding_bytes:
+                preceding_text = preceding_bytes.decode('utf-8', 'ignore').replace('\r\n', '\n').replace('\r', '\n')[-_ROWCOUNT_WINDOW:]
+                row_match = _RE_ROWCOUNT.search(preceding_text)
+                if row_match:
+                    row_count = int(row_match.group(1))
 
             columns = self._parse_columns(columns_block)
 
-            tables.append(Table(
+            tables.append(Table.model_construct(
                 name=table_name,
                 schema_name=schema_name,
                 columns=columns,
@@ -103,94 +329,85 @@ class ToadDdlParser:
         """Parse column definitions from CREATE TABLE block."""
         columns = []
         
-        # Pattern for column definitions
-        col_pattern = re.compile(
-            r'^\s*(\w+)\s+'
-            r'(VARCHAR2|NUMBER|DATE|TIMESTAMP|CHAR|CLOB|BLOB|INTEGER|XMLTYPE|RAW|SYS\.XMLTYPE)'
-            r'(?:\((\d+)(?:\s*BYTE)?(?:,(\d+))?\))?'
-            r'([^,\n]*)',
-            re.IGNORECASE | re.MULTILINE
-        )
-        
-        for match in col_pattern.finditer(columns_block):
-            name, data_type, size, scale, rest = match.groups()
+        # One column per line: NAME TYPE[(size[ BYTE][,scale])] [rest][,]
+        for line in columns_block.split('\n'):
+            parts = line.split(None, 1)
+            if len(parts) < 2:
+                continue
+            name, spec = parts
             
-            # Skip if it looks like a constraint or other non-column
-            if name.upper() in ('SUPPLEMENTAL', 'CONSTRAINT', 'PRIMARY', 'FOREIGN', 'UNIQUE', 'CHECK'):
+            # Names must be plain \w+ identifiers; skip constraints and other non-columns
+            if not name.replace('_', 'A').isalnum() or name.upper() in _SKIP:
                 continue
             
-            nullable = 'NOT NULL' not in (rest or '').upper()
-            default_match = re.search(r'DEFAULT\s+(.+?)(?:\s+NOT|\s+NULL|\s*$)', rest or '', re.IGNORECASE)
-            default_value = default_match.group(1).strip() if default_match else None
+            type_token = spec.split(None, 1)[0].split('(', 1)[0].split(',', 1)[0]
+            data_type = type_token.upper()
+            if data_type not in _TYPES:
+                continue
+            
+            rest = spec[len(type_token):]
+            size = scale = None
+            if rest.startswith('('):
+                size_match = _RE_SIZE.match(rest)
+                if size_match:
+                    size, scale = size_match.groups()
+                    rest = rest[size_match.end():]
+            rest = rest.split(',', 1)[0]
+            rest_upper = rest.upper()
+            
+            nullable = 'NOT NULL' not in rest_upper
+            default_value = None
+            if 'DEFAULT' in rest_upper:
+                default_match = _RE_DEFAULT.search(rest)
+                if default_match:
+                    default_value = default_match.group(1).strip()
             
             columns.append(Column(
                 name=name,
-                data_type=data_type.upper(),
+                data_type=data_type,
                 nullable=nullable,
-                max_length=int(size) if size and data_type.upper() in ('VARCHAR2', 'CHAR', 'RAW') else None,
-                precision=int(size) if size and data_type.upper() == 'NUMBER' else None,
+                max_length=int(size) if size and data_type in ('VARCHAR2', 'CHAR', 'RAW') else None,
+                precision=int(size) if size and data_type == 'NUMBER' else None,
                 scale=int(scale) if scale else None,
                 default_value=default_value
             ))
         
         return columns
     
-    def _parse_table_comments(self) -> dict[str, str]:
+    def _parse_table_comments(self, matches: list[re.Match]) -> dict[str, str]:
         """Extract table-level comments."""
         comments = {}
-        pattern = re.compile(
-            r"COMMENT\s+ON\s+TABLE\s+\w+\.(\w+)\s+IS\s+'((?:[^']|'')*)'",
-            re.IGNORECASE
-        )
-        for match in pattern.finditer(self.content):
-            table, comment = match.groups()
+        for match in matches:
+            table, comment = self._groups(match)
             comments[table] = comment.replace("''", "'")
         return comments
     
-    def _parse_column_comments(self) -> dict[str, dict[str, str]]:
+    def _parse_column_comments(self, matches: list[re.Match]) -> dict[str, dict[str, str]]:
         """Extract column-level comments."""
-        comments = {}
-        pattern = re.compile(
-            r"COMMENT\s+ON\s+COLUMN\s+\w+\.(\w+)\.(\w+)\s+IS\s+'((?:[^']|'')*)'",
-            re.IGNORECASE
-        )
-        for match in pattern.finditer(self.content):
-            table, column, comment = match.groups()
-            if table not in comments:
-                comments[table] = {}
+        comments = defaultdict(dict)
+        for match in matches:
+            table, column, comment = self._groups(match)
             comments[table][column] = comment.replace("''", "'")
-        return comments
+        return dict(comments)
 
-    def _parse_views(self) -> list[View]:
+    def _parse_views(self, matches: list[re.Match]) -> list[View]:
         """Extract view definitions."""
         views = []
 
-        # Pattern to match CREATE OR REPLACE FORCE VIEW blocks (with optional schema prefix)
-        pattern = re.compile(
-            r'CREATE\s+OR\s+REPLACE\s+FORCE\s+VIEW\s+(?:(\w+)\.)?(\w+)\s*\n'
-            r'\((.*?)\)\s*\n'  # Column list
-            r'(?:BEQUEATH\s+DEFINER\s*\n)?'  # Optional BEQUEATH clause
-            r'AS\s*\n'
-            r'(.*?)'  # SELECT statement
-            r'(?=\n\n--|\nGRANT|\nCREATE|\Z)',  # Stop at next section
-            re.DOTALL | re.IGNORECASE
-        )
-
         # Get default schema from metadata
-        metadata = self._parse_metadata()
-        default_schema = metadata.get('schema_name', 'UNKNOWN')
+        default_schema = self.metadata.get('schema_name', 'UNKNOWN')
 
-        for match in pattern.finditer(self.content):
-            schema_name, view_name, columns_str, select_stmt = match.groups()
+        for match in matches:
+            schema_name, view_name, columns_str, select_stmt = self._groups(match)
 
             # Use default schema if not specified
             if not schema_name:
                 schema_name = default_schema
 
             # Parse column names from the column list
-            columns = [col.strip() for col in columns_str.replace('\n', ' ').split(',')]
+            columns = _RE_COMMA.split(columns_str.translate(_WS_TRANS).strip())
 
-            views.append(View(
+            views.append(View.model_construct(
                 name=view_name,
                 schema_name=schema_name,
                 columns=columns,
@@ -199,37 +416,24 @@ class ToadDdlParser:
 
         return views
 
-    def _parse_procedures(self) -> list[Procedure]:
+    def _parse_procedures(self, matches: list[re.Match]) -> list[Procedure]:
         """Extract procedure definitions from package specifications."""
         procedures = []
 
-        # Pattern to match package specifications (with optional schema prefix)
-        pkg_pattern = re.compile(
-            r'CREATE\s+OR\s+REPLACE\s+PACKAGE\s+(?:(\w+)\.)?(\w+)\s+(?:AS|IS)\s*\n'
-            r'(.*?)'
-            r'\nEND\s+\w+;',
-            re.DOTALL | re.IGNORECASE
-        )
-
         # Get default schema from metadata
-        metadata = self._parse_metadata()
-        default_schema = metadata.get('schema_name', 'UNKNOWN')
+        default_schema = self.metadata.get('schema_name', 'UNKNOWN')
 
-        for pkg_match in pkg_pattern.finditer(self.content):
-            schema_name, package_name, package_body = pkg_match.groups()
+        for pkg_match in matches:
+            schema_name, package_name = self._groups(pkg_match)[:2]
 
             # Use default schema if not specified
             if not schema_name:
                 schema_name = default_schema
 
-            # Pattern to match procedure declarations
-            proc_pattern = re.compile(
-                r'PROCEDURE\s+(\w+)\s*\((.*?)\);',
-                re.DOTALL | re.IGNORECASE
-            )
-
-            for proc_match in proc_pattern.finditer(package_body):
-                proc_name, params_str = proc_match.groups()
+            # Scan the package body in place rather than decoding it
+            body_start, body_end = pkg_match.span(3)
+            for proc_match in _RE_PROC.finditer(self._upper, body_start, body_end):
+                proc_name, params_str = self._groups(proc_match)
 
                 # Parse parameters
                 parameters = self._parse_procedure_parameters(params_str)
@@ -241,7 +445,7 @@ class ToadDdlParser:
                     for p in parameters
                 )
 
-                procedures.append(Procedure(
+                procedures.append(Procedure.model_construct(
                     name=proc_name,
                     package_name=package_name,
                     schema_name=schema_name,
@@ -255,63 +459,29 @@ class ToadDdlParser:
         """Parse procedure parameters from parameter string."""
         parameters = []
 
-        # Normalize whitespace and newlines
-        params_str = ' '.join(params_str.split())
-
-        # Split by comma and parse each parameter
-        # Pattern: param_name [IN|OUT|IN OUT] type
-        for param in params_str.split(','):
-            param = param.strip()
-            if not param:
+        for match in _RE_PARAM_ANY.finditer(params_str):
+            param_name, direction, data_type = match.groups()
+            if not param_name:
                 continue
 
-            # Match: name [direction] type
-            match = re.match(
-                r'(\w+)\s+(IN\s+OUT|OUT|IN)\s+(.+)',
-                param,
-                re.IGNORECASE
-            )
-
-            if match:
-                param_name = match.group(1)
-                direction = match.group(2).strip().upper()
-                data_type = match.group(3).strip()
-            else:
-                # Try without explicit direction (defaults to IN)
-                match = re.match(r'(\w+)\s+(.+)', param, re.IGNORECASE)
-                if match:
-                    param_name = match.group(1)
-                    direction = 'IN'
-                    data_type = match.group(2).strip()
-                else:
-                    continue
-
+            # Collapse whitespace and newlines inside the captured tokens
             parameters.append(ProcedureParameter(
                 name=param_name,
-                direction=direction,
-                data_type=data_type
+                direction=' '.join(direction.upper().split()) if direction else 'IN',
+                data_type=' '.join(data_type.split())
             ))
 
         return parameters
 
-    def _parse_primary_keys(self) -> dict[str, PrimaryKey]:
+    def _parse_primary_keys(self, matches: list[re.Match]) -> dict[str, PrimaryKey]:
         """Extract primary key constraints from ALTER TABLE statements."""
         primary_keys = {}
 
-        # Pattern to match ALTER TABLE ... ADD PRIMARY KEY
-        pattern = re.compile(
-            r'ALTER\s+TABLE\s+(\w+)\s+ADD\s+\(\s*\n'
-            r'\s*CONSTRAINT\s+(\w+)\s*\n'
-            r'\s*PRIMARY\s+KEY\s*\n'
-            r'\s*\((.*?)\)',
-            re.DOTALL | re.IGNORECASE
-        )
-
-        for match in pattern.finditer(self.content):
-            table_name, constraint_name, columns_str = match.groups()
+        for match in matches:
+            table_name, constraint_name, columns_str = self._groups(match)
 
             # Parse column list - may be multi-line
-            columns = [col.strip() for col in columns_str.replace('\n', ' ').split(',')]
+            columns = _RE_COMMA.split(columns_str.translate(_WS_TRANS).strip())
 
             primary_keys[table_name] = PrimaryKey(
                 constraint_name=constraint_name,
@@ -320,28 +490,16 @@ class ToadDdlParser:
 
         return primary_keys
 
-    def _parse_foreign_keys(self) -> dict[str, list[ForeignKey]]:
+    def _parse_foreign_keys(self, matches: list[re.Match]) -> dict[str, list[ForeignKey]]:
         """Extract foreign key constraints from ALTER TABLE statements."""
-        foreign_keys = {}
-
-        # Pattern to match ALTER TABLE ... ADD FOREIGN KEY
-        pattern = re.compile(
-            r'ALTER\s+TABLE\s+(\w+)\s+ADD\s+\(\s*\n'
-            r'\s*CONSTRAINT\s+(\w+)\s*\n'
-            r'\s*FOREIGN\s+KEY\s+\((.*?)\)\s*\n'
-            r'\s*REFERENCES\s+(\w+)\s+\((.*?)\)',
-            re.DOTALL | re.IGNORECASE
-        )
+        foreign_keys = defaultdict(list)
 
-        for match in pattern.finditer(self.content):
-            table_name, constraint_name, fk_columns_str, ref_table, ref_columns_str = match.groups()
+        for match in matches:
+            table_name, constraint_name, fk_columns_str, ref_table, ref_columns_str = self._groups(match)
 
             # Parse column lists
-            fk_columns = [col.strip() for col in fk_columns_str.replace('\n', ' ').split(',')]
-            ref_columns = [col.strip() for col in ref_columns_str.replace('\n', ' ').split(',')]
-
-            if table_name not in foreign_keys:
-                foreign_keys[table_name] = []
+            fk_columns = _RE_COMMA.split(fk_columns_str.translate(_WS_TRANS).strip())
+            ref_columns = _RE_COMMA.split(ref_columns_str.translate(_WS_TRANS).strip())
 
             foreign_keys[table_name].append(ForeignKey(
                 constraint_name=constraint_name,
@@ -350,4 +508,4 @@ class ToadDdlParser:
                 referenced_columns=ref_columns
             ))
 
-        return foreign_keys
\ No newline at end of file
+        return dict(foreign_keys)
\ No newline at end of file
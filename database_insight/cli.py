@@ -1,13 +1,108 @@
+import hashlib
+import heapq
+import os
+import tempfile
+import orjson
 import typer
 from pathlib import Path
+from pydantic import BaseModel
 from rich.console import Console
 from rich.table import Table as RichTable
 
+from . import __version__
 from .adapters.toad_parser import ToadDdlParser
+from .models.schema import SchemaModel
 
 app = typer.Typer(help="Database schema analysis tool")
 console = Console()
 
+CACHE_DIR = Path(tempfile.gettempdir()) / "dbinsight_cache"
+
+def _cache_dir() -> Path | None:
+    """Return the parse cache directory, or None if it is unusable or not ours."""
+    try:
+        CACHE_DIR.mkdir(mode=0o700, exist_ok=True)
+        st = CACHE_DIR.stat()
+    except OSError:
+        return None
+    # Cached schemas are served as parse results, so only trust a directory nobody else can write to
+    if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+        return None
+    return CACHE_DIR
+
+def _code_digest() -> str:
+    """Digest of the parser and model sources, so any change to them invalidates cached schemas."""
+    digest = hashlib.blake2b(__version__.encode(), digest_size=16)
+    package_dir = Path(__file__).parent
+    for source in sorted([*(package_dir / "adapters").glob("*.py"), *(package_dir / "models").glob("*.py")]):
+        digest.update(source.name.encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+def load_schema(input_file: Path) -> SchemaModel:
+    """Parse a Toad DDL file, reusing the cached SchemaModel while the file and parser are unchanged."""
+    st = input_file.stat()
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return ToadDdlParser(input_file).parse()
+
+    # Entries are named <path key>-<content key>, so older entries for the same file can be pruned
+    path_key = hashlib.blake2b(str(input_file.resolve()).encode(), digest_size=16).hexdigest()
+    try:
+        entry_key = hashlib.blake2b(
+            f"{_code_digest()}|{st.st_mtime_ns}|{st.st_size}".encode(),
+            digest_size=16,
+        ).hexdigest()
+    except OSError:
+        return ToadDdlParser(input_file).parse()
+    cache_file = cache_dir / f"{path_key}-{entry_key}.json"
+
+    try:
+        return SchemaModel.model_validate_json(cache_file.read_bytes())
+    except Exception:
+        pass  # Missing, stale or corrupt entry: parse again
+
+    schema = ToadDdlParser(input_file).parse()
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        tmp_file.write_text(schema.model_dump_json(), encoding="utf-8")
+        tmp_file.replace(cache_file)
+        for stale in cache_dir.glob(f"{path_key}-*.json"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        # Caching is best effort, but don't leave a partial entry behind
+        try:
+            tmp_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return schema
+
+def write_schema_json(schema: SchemaModel, output: Path) -> None:
+    """Stream the schema to output as indented JSON, one list item at a time.
+
+    Matches schema.model_dump_json(indent=2) for model list items, without
+    building the full dict and JSON document in memory first. Other list
+    items (strings, dataclasses) are encoded by orjson directly.
+    """
+    with output.open("wb") as f:
+        f.write(b"{")
+        for i, name in enumerate(type(schema).model_fields):
+            f.write(b"," if i else b"")
+            f.write(b"\n  " + orjson.dumps(name) + b": ")
+            value = getattr(schema, name)
+            if isinstance(value, list) and value:
+                for j, item in enumerate(value):
+                    f.write(b"," if j else b"[")
+                    data = item.model_dump(mode="json") if isinstance(item, BaseModel) else item
+                    encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+                    f.write(b"\n    " + encoded.replace(b"\n", b"\n    "))
+                f.write(b"\n  ]")
+            else:
+                encoded = orjson.dumps(schema.model_dump(mode="json", include={name})[name], option=orjson.OPT_INDENT_2)
+                f.write(encoded.replace(b"\n", b"\n  "))
+        f.write(b"\n}")
+
 @app.command()
 def analyze(
     input_file: Path = typer.Argument(..., help="Toad DDL export file (.sql)"),
@@ -21,8 +116,7 @@ def analyze(
     
     console.print(f"[blue]Parsing {input_file.name}...[/blue]")
     
-    parser = ToadDdlParser(input_file)
-    schema = parser.parse()
+    schema = load_schema(input_file)
     
     # Summary
     console.print(f"\n[green]Schema: {schema.schema_name}[/green]")
@@ -31,12 +125,14 @@ def analyze(
     console.print(f"Views: {len(schema.views)}")
     console.print(f"Procedures: {len(schema.procedures)}")
 
-    total_columns = sum(len(t.columns) for t in schema.tables)
+    # Count columns and constraints in one pass over the tables
+    total_columns = tables_with_pk = total_fks = 0
+    for t in schema.tables:
+        total_columns += len(t.columns)
+        if t.primary_key:
+            tables_with_pk += 1
+        total_fks += len(t.foreign_keys)
     console.print(f"Columns: {total_columns}")
-
-    # Count constraints
-    tables_with_pk = sum(1 for t in schema.tables if t.primary_key)
-    total_fks = sum(len(t.foreign_keys) for t in schema.tables)
     console.print(f"Primary Keys: {tables_with_pk}")
     console.print(f"Foreign Keys: {total_fks}")
 
@@ -51,15 +147,15 @@ def analyze(
     table.add_column("Rows", justify="right")
     table.add_column("Columns", justify="right")
     
-    sorted_tables = sorted(schema.tables, key=lambda t: t.row_count, reverse=True)[:10]
-    for t in sorted_tables:
+    top_tables = heapq.nlargest(10, schema.tables, key=lambda t: t.row_count)
+    for t in top_tables:
         table.add_row(t.name, f"{t.row_count:,}", str(len(t.columns)))
     
     console.print(table)
     
     # Output JSON if requested
     if output:
-        output.write_text(schema.model_dump_json(indent=2))
+        write_schema_json(schema, output)
         console.print(f"\n[green]Schema written to {output}[/green]")
 
 @app.command()
@@ -67,8 +163,7 @@ def tables(
     input_file: Path = typer.Argument(..., help="Toad DDL export file"),
 ):
     """List all tables in the schema."""
-    parser = ToadDdlParser(input_file)
-    schema = parser.parse()
+    schema = load_schema(input_file)
     
     for t in sorted(schema.tables, key=lambda x: x.name):
         console.print(f"{t.name} ({len(t.columns)} cols, {t.row_count:,} rows)")
@@ -79,10 +174,9 @@ def describe(
     table_name: str = typer.Argument(..., help="Table name"),
 ):
     """Describe a specific table."""
-    parser = ToadDdlParser(input_file)
-    schema = parser.parse()
+    schema = load_schema(input_file)
 
-    table = next((t for t in schema.tables if t.name.upper() == table_name.upper()), None)
+    table = schema.table(table_name)
     if not table:
         console.print(f"[red]Table not found: {table_name}[/red]")
         raise typer.Exit(1)
@@ -145,8 +239,7 @@ def views(
     input_file: Path = typer.Argument(..., help="Toad DDL export file"),
 ):
     """List all views in the schema."""
-    parser = ToadDdlParser(input_file)
-    schema = parser.parse()
+    schema = load_schema(input_file)
 
     for v in sorted(schema.views, key=lambda x: x.name):
         console.print(f"{v.name} ({len(v.columns)} cols)")
@@ -157,8 +250,7 @@ def procedures(
     refcursor_only: bool = typer.Option(False, "--refcursor", "-r", help="Show only procedures with REF CURSOR OUT"),
 ):
     """List all procedures in the schema."""
-    parser = ToadDdlParser(input_file)
-    schema = parser.parse()
+    schema = load_schema(input_file)
 
     procs = schema.procedures
     if refcursor_only:
@@ -174,10 +266,9 @@ def describe_view(
     view_name: str = typer.Argument(..., help="View name"),
 ):
     """Describe a specific view."""
-    parser = ToadDdlParser(input_file)
-    schema = parser.parse()
+    schema = load_schema(input_file)
 
-    view = next((v for v in schema.views if v.name.upper() == view_name.upper()), None)
+    view = schema.view(view_name)
     if not view:
         console.print(f"[red]View not found: {view_name}[/red]")
         raise typer.Exit(1)
@@ -193,16 +284,14 @@ def describe_procedure(
     procedure_name: str = typer.Argument(..., help="Procedure name (Package.Procedure)"),
 ):
     """Describe a specific procedure."""
-    parser = ToadDdlParser(input_file)
-    schema = parser.parse()
+    schema = load_schema(input_file)
 
     # Parse package.procedure format
     if '.' in procedure_name:
-        pkg_name, proc_name = procedure_name.upper().split('.', 1)
-        proc = next((p for p in schema.procedures
-                    if p.package_name.upper() == pkg_name and p.name.upper() == proc_name), None)
+        pkg_name, proc_name = procedure_name.split('.', 1)
+        proc = schema.procedure(proc_name, pkg_name)
     else:
-        proc = next((p for p in schema.procedures if p.name.upper() == procedure_name.upper()), None)
+        proc = schema.procedure(procedure_name)
 
     if not proc:
         console.print(f"[red]Procedure not found: {procedure_name}[/red]")
@@ -1,7 +1,12 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
+from pydantic import BaseModel, PrivateAttr
 from datetime import datetime
 
-class Column(BaseModel):
+# Leaf records are slotted dataclasses: schemas hold them by the tens of
+# thousands, and pydantic validates and serializes dataclass fields natively.
+
+@dataclass(slots=True)
+class Column:
     name: str
     data_type: str
     nullable: bool = True
@@ -11,11 +16,13 @@ class Column(BaseModel):
     default_value: str | None = None
     comment: str | None = None
 
-class PrimaryKey(BaseModel):
+@dataclass(slots=True)
+class PrimaryKey:
     constraint_name: str
     columns: list[str]
 
-class ForeignKey(BaseModel):
+@dataclass(slots=True)
+class ForeignKey:
     constraint_name: str
     columns: list[str]
     referenced_table: str
@@ -37,7 +44,8 @@ class View(BaseModel):
     select_statement: str  # The SELECT query
     comment: str | None = None
 
-class ProcedureParameter(BaseModel):
+@dataclass(slots=True)
+class ProcedureParameter:
     name: str
     direction: str  # IN, OUT, IN OUT
     data_type: str
@@ -56,4 +64,36 @@ class SchemaModel(BaseModel):
     extracted_at: datetime
     tables: list[Table]
     views: list[View] = []
-    procedures: list[Procedure] = []
\ No newline at end of file
+    procedures: list[Procedure] = []
+
+    # Case-insensitive lookup indexes, built on first use
+    _tables_by_name: dict[str, Table] | None = PrivateAttr(default=None)
+    _views_by_name: dict[str, View] | None = PrivateAttr(default=None)
+    _procedures_by_name: dict[str | tuple[str, str], Procedure] | None = PrivateAttr(default=None)
+
+    def table(self, name: str) -> Table | None:
+        """Find a table by name, ignoring case."""
+        if self._tables_by_name is None:
+            self._tables_by_name = {}
+            for t in self.tables:
+                self._tables_by_name.setdefault(t.name.upper(), t)
+        return self._tables_by_name.get(name.upper())
+
+    def view(self, name: str) -> View | None:
+        """Find a view by name, ignoring case."""
+        if self._views_by_name is None:
+            self._views_by_name = {}
+            for v in self.views:
+                self._views_by_name.setdefault(v.name.upper(), v)
+        return self._views_by_name.get(name.upper())
+
+    def procedure(self, name: str, package_name: str | None = None) -> Procedure | None:
+        """Find a procedure by name, optionally within a package, ignoring case."""
+        if self._procedures_by_name is None:
+            self._procedures_by_name = {}
+            for p in self.procedures:
+                self._procedures_by_name.setdefault((p.package_name.upper(), p.name.upper()), p)
+                self._procedures_by_name.setdefault(p.name.upper(), p)
+        if package_name is not None:
+            return self._procedures_by_name.get((package_name.upper(), name.upper()))
+        return self._procedures_by_name.get(name.upper())
\ No newline at end of file